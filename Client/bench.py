@@ -30,40 +30,99 @@
 # run_benchmark() may raise utils.OpenBenchBadBenchException.
 # An associated error message, including the binary name, is included
 
-import multiprocessing
+import ctypes
 import os
+import psutil
 import re
 import subprocess
 import sys
 
+from concurrent.futures import ThreadPoolExecutor
+from utils import IS_LINUX, IS_WINDOWS
 from utils import OpenBenchBadBenchException
 
+# Multiple methods, including Ethereal and Stockfish
+NPS_REGEX     = re.compile(r'(\d+\s+nps)|(nps\s+\d+)|(nodes second\s+\d+)', re.IGNORECASE)
+BENCH_REGEX   = re.compile(r'(\d+\s+nodes)|(nodes\s+\d+)|(nodes searched\s+\d+)', re.IGNORECASE)
+SYMBOLS_REGEX = re.compile(r'[^a-zA-Z0-9 ]+')
+
+def reversed_lines(text):
+
+    # Yield lines from the end, without splitting the entire output
+    end = len(text)
+    while end > 0:
+        start = text.rfind('\n', 0, end)
+        yield text[start+1:end]
+        end = start
+
 def parse_stream_output(stream):
 
-    nps = bench = None # Search through output Stream
-    for line in stream.decode('ascii').strip().split('\n')[::-1]:
+    nps = bench = None # Search backwards through output Stream
+    for line in reversed_lines(stream.strip()):
 
         # Convert non alpha-numerics to spaces
-        line = re.sub(r'[^a-zA-Z0-9 ]+', ' ', line)
-
-        # Multiple methods, including Ethereal and Stockfish
-        nps_pattern   = r'(\d+\s+nps)|(nps\s+\d+)|(nodes second\s+\d+)'
-        bench_pattern = r'(\d+\s+nodes)|(nodes\s+\d+)|(nodes searched\s+\d+)'
+        line = SYMBOLS_REGEX.sub(' ', line)
 
         # Search for and set only once the NPS and Bench values
-        re_nps = re.search(nps_pattern, line, re.IGNORECASE)
-        re_bench = re.search(bench_pattern, line, re.IGNORECASE)
+        re_nps   = NPS_REGEX.search(line)
+        re_bench = BENCH_REGEX.search(line)
 
         # Set, but don't override
         if re_nps: nps = nps if nps else re_nps.group()
         if re_bench: bench = bench if bench else re_bench.group()
 
+        # Both are reported at the end, so stop once found
+        if nps and bench:
+            break
+
     # Parse out the integer portion from our matches
     nps   = int(re.search(r'\d+', nps  ).group()) if nps   else None
     bench = int(re.search(r'\d+', bench).group()) if bench else None
     return (bench, nps)
 
-def single_core_bench(binary, network, private, outqueue):
+def pin_thread_to_core(core):
+
+    # Linux affinities are per thread, so pin the calling thread, and the bench inherits it from birth
+    try: os.sched_setaffinity(0, { core })
+    except (AttributeError, ValueError, OSError): pass
+
+def pin_process_to_core(pid, core):
+
+    # Windows affinities cover every thread of the process, so the bench may be pinned once started
+    try: psutil.Process(pid).cpu_affinity([core])
+    except (AttributeError, ValueError, psutil.Error): pass
+
+def processor_group_size(cores):
+
+    # Windows only reports the affinity within our processor group, of at most 64 CPUs
+    if IS_WINDOWS:
+        try:
+            kernel32 = ctypes.windll.kernel32
+            kernel32.GetCurrentProcess.restype = ctypes.c_void_p
+
+            # The system mask holds every CPU of our group, whatever mask the user launched us with
+            process, system = ctypes.c_size_t(), ctypes.c_size_t()
+            handle = ctypes.c_void_p(kernel32.GetCurrentProcess())
+            if kernel32.GetProcessAffinityMask(handle, ctypes.byref(process), ctypes.byref(system)):
+                return bin(system.value).count('1')
+        except (AttributeError, OSError): pass
+        return len(cores)
+
+    return psutil.cpu_count(logical=True) or len(cores)
+
+def pinnable_cores(threads):
+
+    # Cores this process may use, or None if affinities are not supported
+    try: cores = psutil.Process().cpu_affinity()
+    except (AttributeError, psutil.Error): return None
+
+    # Only pin within a mask the user restricted us to, and never more than one bench per core.
+    # Otherwise the OS places benches better than us, since SMT sibling numbering varies by OS,
+    # and other workers on the machine would be pinned onto the very same cores
+    explicit = len(cores) < processor_group_size(cores)
+    return cores if explicit and threads <= len(cores) else None
+
+def single_core_bench(binary, network, private, core=None):
 
     # Basic command for Public engines
     cmd = ['./%s' % (binary), 'bench']
@@ -73,28 +132,28 @@ def single_core_bench(binary, network, private, outqueue):
         option = 'setoption name EvalFile value %s' % (network)
         cmd = ['./%s' % (binary), option, 'bench', 'quit']
 
-    try: # Launch the bench and wait for results
-        stdout, stderr = subprocess.Popen(
-            cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT
-        ).communicate()
-        outqueue.put(parse_stream_output(stdout))
+    try: # Launch the bench, pin it to its own core, and wait for results
+        if core is not None and IS_LINUX: pin_thread_to_core(core)
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            encoding='ascii', errors='replace')
+        if core is not None and IS_WINDOWS: pin_process_to_core(process.pid, core)
+        return parse_stream_output(process.communicate()[0])
 
     except: # Signal an error with (None, None)
-        outqueue.put((None, None))
+        return (None, None)
 
 def multi_core_bench(binary, network, private, threads):
 
-    outqueue = multiprocessing.Queue()
-
-    processes = [
-        multiprocessing.Process(
-            target=single_core_bench,
-            args=(binary, network, private, outqueue)
-        ) for ii in range(threads)
-    ]
+    # Spread the benches over distinct cores, when the user has given us a set of them
+    cores = pinnable_cores(threads) or [None] * threads
 
-    for process in processes: process.start()
-    return [outqueue.get() for ii in range(threads)]
+    # Each thread simply waits on its own bench subprocess
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        tasks = [
+            executor.submit(single_core_bench, binary, network, private, cores[ii])
+                for ii in range(threads)
+        ]
+        return [task.result() for task in tasks]
 
 def run_benchmark(binary, network, private, threads, sets, expected=None):
 
@@ -3,6 +3,9 @@ rm -rf Books/
 rm -rf Engines/
 rm -rf PGNS/
 rm -rf Networks/
+rm -rf SourceCache/
+rm -rf Temp/
 rm -rf __pycache__/
 
-rm machine.txt
\ No newline at end of file
+rm machine.txt
+rm bench_cache.json
\ No newline at end of file
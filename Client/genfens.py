@@ -112,11 +112,12 @@ def genfens_command_builder(binary, network, private, N, book, extra_args, seed)
 def genfens_single_threaded(command, queue):
 
     try:
-        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            encoding='utf-8', errors='replace', bufsize=1 << 16)
 
-        for line in iter(process.stdout.readline, b''):
-            if line.decode('utf-8').startswith('info string genfens '):
-                queue.put(line.decode('utf-8').split('genfens ')[1].rstrip())
+        for line in process.stdout:
+            if line.startswith('info string genfens '):
+                queue.put(line[len('info string genfens '):].rstrip())
 
         process.wait()
 
@@ -20,14 +20,19 @@
 
 import argparse
 import hashlib
+import io
 import os
 import platform
 import requests
 import shutil
 import subprocess
 import tempfile
+import threading
 import zipfile
 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 IS_WINDOWS = platform.system() == 'Windows' # Don't touch this
 IS_LINUX   = platform.system() != 'Windows' # Don't touch this
 
@@ -74,6 +79,27 @@ class OpenBenchFailedGenfensException(Exception):
         super().__init__(self.message)
 
 
+def create_http_session():
+
+    # Retry transient gateway errors, backing off between each attempt
+    retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retries)
+
+    # Share one adapter for both HTTP and HTTPS connections
+    session = requests.Session()
+    session.mount('http://' , adapter)
+    session.mount('https://', adapter)
+    return session
+
+# Shared by all requests, to reuse connections instead of a new TCP + TLS handshake each time
+HTTP_SESSION = create_http_session()
+
+# Dev and Base may be fetched at once, but git must not operate on the cache concurrently
+SOURCE_CACHE_LOCK = threading.Lock()
+
+# Seconds before abandoning a git operation, and falling back to the .zip download
+TIMEOUT_GIT = 300
+
 def kill_process_by_name(process_name):
 
     if IS_LINUX:
@@ -120,12 +146,12 @@ def credentialed_cmdline_args(parser=None):
 
     return args
 
-def credentialed_request(server, username, password, endpoint):
+def credentialed_request(server, username, password, endpoint, stream=False):
 
     target  = url_join(server, *endpoint.split('/'))
     payload = { 'username' : username, 'password' : password }
 
-    return requests.post(data=payload, url=target)
+    return HTTP_SESSION.post(data=payload, url=target, stream=stream)
 
 def read_git_credentials(engine):
     fname = 'credentials.%s' % (engine.replace(' ', '').lower())
@@ -151,10 +177,11 @@ def check_for_engine_binary(out_path):
     if os.path.isfile('%s.exe' % (out_path)):
         return '%s.exe' % (out_path)
 
-def makefile_command(net_path, make_path, out_path, compiler):
+def makefile_command(net_path, make_path, out_path, compiler, threads=None):
 
-    # Build with -j, and EXE= to contol the output location
-    command = ['make', '-j', 'EXE=%s' % (out_path)]
+    # Build with -j, capped to our threads if known, and EXE= to contol the output location
+    jobs    = ['-j', str(threads)] if threads else ['-j']
+    command = ['make'] + jobs + ['EXE=%s' % (out_path)]
 
     # Build with CC/CXX= when using a custom compiler
     if compiler:
@@ -213,6 +240,116 @@ def select_best_artifact(options, cpu_name, cpu_flags):
     return options[artifacts[0]]
 
 
+def temp_directory():
+
+    # Stage under Temp/, on the same filesystem as Books/ and Engines/, so final moves are a rename.
+    # Anything left behind by a killed worker is removed by cleanup_client() or cleanup.sh
+    os.makedirs('Temp', exist_ok=True)
+    return tempfile.TemporaryDirectory(dir='Temp')
+
+def download_zip(source, headers=None):
+
+    # The response is held in memory anyway, so open it without writing the .zip to disk
+    response = HTTP_SESSION.get(source, headers=headers)
+    return zipfile.ZipFile(io.BytesIO(response.content), 'r')
+
+def download_and_extract(source, unzip_path, headers=None):
+    with download_zip(source, headers) as zip_file:
+        zip_file.extractall(unzip_path)
+
+def git_command(*args):
+
+    # Never prompt for credentials, and raise CalledProcessError or TimeoutExpired on any failure
+    env = {
+        **os.environ,
+        'GIT_TERMINAL_PROMPT' : '0',
+        'GIT_CONFIG_NOSYSTEM' : '1',
+        'GIT_CONFIG_GLOBAL'   : os.devnull,
+    }
+
+    # Ignore user config, and checkout LF like Github's .zip, so both paths build the same bytes
+    config = ['-c', 'core.autocrlf=false', '-c', 'core.eol=lf']
+    subprocess.run(['git', *config, *args], env=env, check=True, timeout=TIMEOUT_GIT,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+def checkout_cached_source(source, commit_sha, src_path):
+
+    # Only possible for Github archives of a known commit, when we have git
+    if not commit_sha or '/archive/' not in source or not shutil.which('git'):
+        return False
+
+    # One bare cache per repository, such as SourceCache/AndyGrant.Ethereal
+    repo  = source.split('/archive/')[0].rstrip('/')
+    cache = os.path.join('SourceCache', '.'.join(repo.split('/')[-2:]))
+
+    with SOURCE_CACHE_LOCK:
+
+        try:
+            # Blobless clone, so each checkout only fetches the files it needs
+            if not os.path.isdir(cache):
+                git_command('clone', '--bare', '--filter=blob:none', repo, cache)
+
+        except (OSError, subprocess.CalledProcessError, subprocess.TimeoutExpired):
+            shutil.rmtree(cache, ignore_errors=True)
+            return False
+
+        try:
+            # Fetch only the commit we need, and write a clean copy of it to src_path
+            os.makedirs(src_path)
+            git_command('--git-dir', cache, 'fetch', 'origin', commit_sha)
+            git_command('--git-dir', cache, '--work-tree', src_path, 'checkout', '-f', commit_sha, '--', '.')
+
+            # Mark the cache as recently used, for cleanup_client()
+            os.utime(cache)
+            return True
+
+        except (OSError, subprocess.CalledProcessError, subprocess.TimeoutExpired):
+            shutil.rmtree(src_path, ignore_errors=True)
+            return False
+
+class UniversalNewlineHasher:
+
+    ## sha256 of the content as Python's text mode reads it, with '\r\n' and '\r' read as
+    ## '\n'. Opening Books were always hashed this way, so the configured SHAs depend on it
+
+    def __init__(self):
+        self.hasher  = hashlib.sha256()
+        self.pending = False # Previous chunk ended with '\r', which may begin a '\r\n'
+
+    def update(self, chunk):
+
+        if not chunk:
+            return
+
+        # Drop the '\n' of a '\r\n' that was split between chunks
+        if self.pending and chunk.startswith(b'\n'):
+            chunk = chunk[1:]
+
+        self.pending = chunk.endswith(b'\r')
+        self.hasher.update(chunk.replace(b'\r\n', b'\n').replace(b'\r', b'\n'))
+
+    def hexdigest(self):
+        return self.hasher.hexdigest()
+
+def sha256_of_file(path, hasher=hashlib.sha256):
+
+    # Hash in 1MB chunks, to avoid reading the entire file at once
+    with open(path, 'rb') as fin:
+        hasher = hasher()
+        for chunk in iter(lambda: fin.read(1 << 20), b''):
+            hasher.update(chunk)
+        return hasher.hexdigest()
+
+def write_and_hash(chunks, path, hasher=hashlib.sha256):
+
+    # Hash while writing, to avoid a second pass over the file
+    with open(path, 'wb', buffering=1 << 20) as fout:
+        hasher = hasher()
+        for chunk in chunks:
+            hasher.update(chunk)
+            fout.write(chunk)
+        return hasher.hexdigest()
+
 def download_opening_book(book_sha, book_source, book_name):
 
     book_path = os.path.join('Books', book_name)
@@ -227,26 +364,22 @@ def download_opening_book(book_sha, book_source, book_name):
         print ('Fetching Opening Book [%s]' % (book_name))
 
         # Work with temp files and directories until finished extracting
-        with tempfile.TemporaryDirectory() as temp_dir:
+        with temp_directory() as temp_dir:
 
-            # Download the zip file from Github
-            zip_path = os.path.join(temp_dir, '%s.zip' % (book_name))
-            with open(zip_path, 'wb') as zip_file:
-                zip_file.write(requests.get(book_source).content)
+            # Download the zip, then extract and hash the sole book in 1MB chunks
+            with download_zip(book_source) as zip_file:
+                member    = [x for x in zip_file.infolist() if not x.is_dir()][0]
+                temp_path = os.path.join(temp_dir, book_name)
+                with zip_file.open(member) as fin:
+                    chunks = iter(lambda: fin.read(1 << 20), b'')
+                    sha256 = write_and_hash(chunks, temp_path, UniversalNewlineHasher)
 
-            # Unzip the book to a directory
-            unzip_path = os.path.join(temp_dir, book_name)
-            with zipfile.ZipFile(zip_path, 'r') as zip_file:
-                zip_file.extractall(unzip_path)
+            # Move the book into place, still to be verified
+            shutil.move(temp_path, book_path)
 
-            # Rename the sole binary
-            unzip_root = os.path.join(unzip_path, os.listdir(unzip_path)[0])
-            shutil.move(unzip_root, book_path)
-
-    # Verify SHAs match with the server
-    with open(book_path) as fin:
-        content = fin.read().encode('utf-8')
-        sha256  = hashlib.sha256(content).hexdigest()
+    # Otherwise hash the existing book, in 1MB chunks
+    else:
+        sha256 = sha256_of_file(book_path, UniversalNewlineHasher)
 
     # Log SHAs on every workload
     print ('Correct  %s' % (book_sha.upper()))
@@ -265,28 +398,24 @@ def download_network(server, username, password, engine, net_name, net_sha, net_
         # Format the API request, including credentials
         print ('Fetching %s (%s) for %s' % (net_name, net_sha, engine))
         endpoint = 'api/networks/%s/%s' % (engine, net_sha)
-        request  = credentialed_request(server, username, password, endpoint)
+        request  = credentialed_request(server, username, password, endpoint, stream=True)
 
-        # Write the content out to the net_path in kb chunks
-        with open(net_path, 'wb') as fout:
-            for chunk in request.iter_content(chunk_size=1024):
-                if chunk: fout.write(chunk)
-            fout.flush()
+        # Stream the content out to the net_path in 256kb chunks, hashing along the way
+        sha256 = write_and_hash(request.iter_content(chunk_size=1 << 18), net_path)[:8]
 
     else:
         print ('Found %s (%s) for %s' % (net_name, net_sha, engine))
+        sha256 = sha256_of_file(net_path)[:8]
 
     # Check for the first 8 characters of the sha256
     print ('Verifying %s (%s) for %s\n' % (net_name, net_sha, engine))
-    with open(net_path, 'rb') as network:
-        sha256 = hashlib.sha256(network.read()).hexdigest()[:8]
 
     # Verify the download and delete partial or corrupted ones
     if net_sha.upper() != sha256.upper():
         os.remove(net_path)
         raise OpenBenchCorruptedNetworkException('Invalid SHA for %s' % (net_name))
 
-def download_public_engine(engine, net_path, branch, source, make_path, out_path, compiler=None):
+def download_public_engine(engine, net_path, branch, source, make_path, out_path, compiler=None, threads=None, commit_sha=None):
 
     # Check to see if we already have the binary
     if check_for_engine_binary(out_path):
@@ -294,32 +423,32 @@ def download_public_engine(engine, net_path, branch, source, make_path, out_path
         return os.path.basename(check_for_engine_binary(out_path))
 
     # Work with temp files and directories until finished building
-    with tempfile.TemporaryDirectory() as temp_dir:
+    with temp_directory() as temp_dir:
 
         print('Building [%s-%s]' % (engine, branch))
 
-        # Download the zip file from Github
-        zip_path = os.path.join(temp_dir, '%s-tmp' % (engine))
-        with open(zip_path, 'wb') as zip_file:
-            zip_file.write(requests.get(source).content)
+        # Prefer a checkout from our git cache, to avoid downloading the entire source
+        src_path = os.path.join(temp_dir, '%s-tmp' % (engine))
+        if not checkout_cached_source(source, commit_sha, src_path):
 
-        # Unzip the engine to a directory called <engine>
-        unzip_path = os.path.join(temp_dir, engine)
-        with zipfile.ZipFile(zip_path, 'r') as zip_file:
-            zip_file.extractall(unzip_path)
+            # Download and unzip the engine to a directory called <engine>
+            unzip_path = os.path.join(temp_dir, engine)
+            download_and_extract(source, unzip_path)
 
-        # Rename the Root folder for ease of conventions
-        unzip_root = os.path.join(unzip_path, os.listdir(unzip_path)[0])
-        src_path   = os.path.join(unzip_path, '%s-tmp' % (engine))
-        os.rename(unzip_root, src_path)
+            # Rename the Root folder for ease of conventions
+            unzip_root = os.path.join(unzip_path, os.listdir(unzip_path)[0])
+            shutil.move(unzip_root, src_path)
 
         # Prepare the MAKEFILE command
         make_path = os.path.join(src_path, make_path)
         bin_path  = os.path.join(make_path, os.path.basename(out_path))
-        make_cmd  = makefile_command(net_path, make_path, os.path.basename(out_path), compiler)
+        make_cmd  = makefile_command(net_path, make_path, os.path.basename(out_path), compiler, threads)
+
+        # Temp/ is inside the OpenBench checkout, so stop git in the Makefile from finding our repo
+        make_env = { **os.environ, 'GIT_CEILING_DIRECTORIES' : os.path.abspath('Temp') }
 
         # Build the engine, which will produce a binary to bin_path, to be moved after
-        process     = subprocess.Popen(make_cmd, cwd=make_path, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        process     = subprocess.Popen(make_cmd, cwd=make_path, env=make_env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
         comp_output = process.communicate()[0].decode('utf-8')
 
         # Verify that the compilation subprocess did not exit with errors
@@ -348,24 +477,18 @@ def download_private_engine(engine, branch, source, out_path, cpu_name, cpu_flag
 
     # Pick the best artifact to match this machine
     headers   = read_git_credentials(engine)
-    artifacts = requests.get(url=source, headers=headers).json()['artifacts']
+    artifacts = HTTP_SESSION.get(url=source, headers=headers).json()['artifacts']
     options   = { artifact['name'] : artifact for artifact in artifacts }
     best      = select_best_artifact(options, cpu_name, cpu_flags)
 
     # Work with temp files and directories until finished extracting
-    with tempfile.TemporaryDirectory() as temp_dir:
+    with temp_directory() as temp_dir:
 
         print('Fetching [%s-%s]' % (engine, branch))
 
-        # Download the zip file from Github
-        zip_path = os.path.join(temp_dir, '%s-tmp' % (engine))
-        with open(zip_path, 'wb') as zip_file:
-            zip_file.write(requests.get(best['archive_download_url'], headers=headers).content)
-
-        # Unzip the engine to a directory called <engine>
+        # Download and unzip the engine to a directory called <engine>
         unzip_path = os.path.join(temp_dir, engine)
-        with zipfile.ZipFile(zip_path, 'r') as zip_file:
-            zip_file.extractall(unzip_path)
+        download_and_extract(best['archive_download_url'], unzip_path, headers)
 
         # Rename the sole binary
         unzip_root = os.path.join(unzip_path, os.listdir(unzip_path)[0])
@@ -373,7 +496,7 @@ def download_private_engine(engine, branch, source, out_path, cpu_name, cpu_flag
 
     # Might not have execution permissions set
     if platform.system() != 'Windows':
-        os.system('chmod 777 %s\n' % (out_path))
+        os.chmod(out_path, 0o755)
 
     # Check to see if we already have the binary
     if check_for_engine_binary(out_path):
@@ -21,13 +21,14 @@
 import argparse
 import cpuinfo
 import json
-import multiprocessing
+import math
 import os
 import platform
 import psutil
 import queue
+import random
 import re
-import requests
+import shutil
 import subprocess
 import sys
 import threading
@@ -58,11 +59,15 @@ CLIENT_VERSION   = 28 # Client version to send to the Server
 TIMEOUT_HTTP     = 30 # Timeout in seconds for HTTP requests
 TIMEOUT_ERROR    = 10 # Timeout in seconds when any errors are thrown
 TIMEOUT_WORKLOAD = 30 # Timeout in seconds between workload requests
+TIMEOUT_BACKOFF  = 600 # Maximum timeout in seconds after repeated errors
 REPORT_INTERVAL  = 30 # Seconds between reports to the Server
+BENCH_CACHE_TTL  = 60 * 60 # Seconds to reuse a binary's benchmark results
 
 IS_WINDOWS = platform.system() == 'Windows' # Don't touch this
 IS_LINUX   = platform.system() != 'Windows' # Don't touch this
 
+QUIET_CUTECHESS_LINES = ('Started game', 'Score of') # Not echoed to the console
+
 
 class Configuration:
 
@@ -89,6 +94,7 @@ class Configuration:
         self.secret_token   = 'None'
         self.syzygy_max     = 2
         self.blacklist      = []
+        self.retry_after    = TIMEOUT_WORKLOAD
 
         self.process_args(args) # Rest of the command line settings
         self.init_client()      # Create folder structure and verify Syzygy
@@ -229,7 +235,7 @@ class ServerReporter:
         payload['secret']     = config.secret_token
 
         target   = url_join(config.server, endpoint)
-        response = requests.post(target, data=payload, files=files, timeout=TIMEOUT_HTTP)
+        response = HTTP_SESSION.post(target, data=payload, files=files, timeout=TIMEOUT_HTTP)
 
         # Check for a json repsone, to look for Client Version Errors
         try: as_json = response.json()
@@ -369,7 +375,7 @@ class ServerReporter:
 
 class Cutechess:
 
-    ## Handles building the very long string of arguments that need to be passed
+    ## Handles building the very long list of arguments that need to be passed
     ## to cutechess in order to launch a set of games. Operates on the Configuration,
     ## and a small number of secondary arguments that are not housed in the Configuration
 
@@ -386,16 +392,16 @@ class Cutechess:
         no_reverse = is_datagen and not config.workload['test']['play_reverses']
 
         # Always include -recover and -variant
-        return ['-repeat', ''][no_reverse] + ' -recover -variant %s' % (variant)
+        return ['-repeat'] * (not no_reverse) + ['-recover', '-variant', variant]
 
     @staticmethod
     def concurrency_settings(config):
 
         # Already computed for us by the Server
-        return '-concurrency %d -games %d' % (
-            config.workload['distribution']['concurrency-per'],
-            config.workload['distribution']['games-per-cutechess'],
-        )
+        return [
+            '-concurrency', str(config.workload['distribution']['concurrency-per']),
+            '-games'      , str(config.workload['distribution']['games-per-cutechess']),
+        ]
 
     @staticmethod
     def adjudication_settings(config):
@@ -406,19 +412,19 @@ class Cutechess:
         syzygy_adj = config.workload['test']['syzygy_adj']
 
         # Empty, unless specified in the settings
-        win_flags    = ['', '-resign ' + win_adj ][win_adj  != 'None']
-        draw_flags   = ['', '-draw '   + draw_adj][draw_adj != 'None']
-        syzygy_flags = ''
+        win_flags    = [[], ['-resign'] + win_adj.split() ][win_adj  != 'None']
+        draw_flags   = [[], ['-draw'  ] + draw_adj.split()][draw_adj != 'None']
+        syzygy_flags = []
 
         # Set the tb path if we have them, and are allowed to use them
         if syzygy_adj != 'DISABLED' and config.syzygy_max:
-            syzygy_flags = '-tb %s' % (config.syzygy_path.replace('\\', '\\\\'))
+            syzygy_flags = ['-tb', config.syzygy_path.replace('\\', '\\\\')]
 
         # We would only get a test we can do; specify a limit if needed
         if syzygy_adj != 'DISABLED' and syzygy_adj != 'OPTIONAL':
-            syzygy_flags += ' -tbpieces %s' % (syzygy_adj.split('-')[0])
+            syzygy_flags += ['-tbpieces', syzygy_adj.split('-')[0]]
 
-        return '%s %s %s' % (win_flags, draw_flags, syzygy_flags)
+        return win_flags + draw_flags + syzygy_flags
 
     @staticmethod
     def book_settings(config, cutechess_idx):
@@ -430,7 +436,7 @@ class Cutechess:
             no_reverse = not config.workload['test']['play_reverses']
             pairs      = config.workload['distribution']['games-per-cutechess'] // 2
             start      = 1 + (cutechess_idx * pairs * (1 + no_reverse))
-            return '-openings file=Books/openbench.genfens.epd format=epd order=sequential start=%d' % (start)
+            return ['-openings', 'file=Books/openbench.genfens.epd', 'format=epd', 'order=sequential', 'start=%d' % (start)]
 
         # Can handle EPD and PGN Books, which must be specified
         book_name   = config.workload['test']['book']['name']
@@ -440,8 +446,10 @@ class Cutechess:
         pairs = config.workload['distribution']['games-per-cutechess'] // 2
         start = config.workload['test']['book_index'] + cutechess_idx * pairs
 
-        return '-openings file=Books/%s format=%s order=random start=%d -srand %d' % (
-            book_name, book_suffix, start, config.workload['test']['book_seed'])
+        return [
+            '-openings', 'file=Books/%s' % (book_name), 'format=%s' % (book_suffix),
+            'order=random', 'start=%d' % (start), '-srand', str(config.workload['test']['book_seed']),
+        ]
 
     @staticmethod
     def engine_settings(config, command, branch, scale_factor, cutechess_idx):
@@ -457,72 +465,66 @@ class Cutechess:
         name    = command.replace('.exe', '')
         control = scale_time_control(config.workload, scale_factor, branch)
 
+        # Split the user's options, where quotes group a single option containing spaces
+        options = [x.strip('"') for x in re.findall(r'"[^"]*"|\S+', options)]
+
         # Private engines, when using Networks, must set them via UCI
         if private and network and network != 'None':
-            options += ' EvalFile=%s' % (os.path.join('../Networks', network))
+            options += ['EvalFile=%s' % (os.path.join('../Networks', network))]
             name    += '-%s' % (network)
 
         # Set the SyzygyPath if we have them, and are allowed to use them
         if syzygy != 'DISABLED' and config.syzygy_max:
-            options += ' SyzygyPath=%s' % (config.syzygy_path.replace('\\', '\\\\'))
+            options += ['SyzygyPath=%s' % (config.syzygy_path.replace('\\', '\\\\'))]
 
         # Set a SyzygyProbeLimit if we may only use up-to N-Man
         if syzygy != 'DISABLED' and syzygy != 'OPTIONAL':
-            options += ' SyzygyProbeLimit=%s' % (syzygy.split('-')[0])
+            options += ['SyzygyProbeLimit=%s' % (syzygy.split('-')[0])]
 
         # Add any of the custom SPSA settings
         if config.workload['test']['type'] == 'SPSA':
             for param, data in config.workload['spsa'].items():
-                options += ' %s=%s' % (param, str(data[branch][cutechess_idx]))
+                options += ['%s=%s' % (param, str(data[branch][cutechess_idx]))]
 
-        # Join options together in the Cutechess format
-        options = ' option.'.join([''] + re.findall(r'"[^"]*"|\S+', options))
-        return '-engine dir=Engines/ cmd=./%s proto=uci %s%s name=%s-%s' % (command, control, options, engine, branch)
+        # Prefix options in the Cutechess format
+        options = ['option.%s' % (x) for x in options]
+        return ['-engine', 'dir=Engines/', 'cmd=./%s' % (command), 'proto=uci'] \
+             + control.split() + options + ['name=%s-%s' % (engine, branch)]
 
     @staticmethod
     def pgnout_settings(config, timestamp, cutechess_idx):
-        return '-pgnout %s' % (Cutechess.pgn_name(config, timestamp, cutechess_idx))
-
-    @staticmethod
-    def update_results(results, line):
+        return ['-pgnout', Cutechess.pgn_name(config, timestamp, cutechess_idx)]
 
-        # Given any game #, find the other in the pair
-        def game_to_pair(g):
-            return (g, g+1) if g % 2 else (g-1, g)
+    # Format: Finished game <N> (<White> vs <Black>): <Result> {<Reason>}
+    FINISHED_GAME_REGEX = re.compile(r'Finished game (\d+) \(.*\): (\S+) \{(.*)\}')
 
-        # Find the Pentanomial index given a game pair
-        def pair_to_penta(r1, r2):
-            lookup = { '0-1' : 0, '1/2-1/2' : 1, '1-0' : 2 }
-            return lookup[r1] + 2 - lookup[r2]
+    # Index of each result in the Trinomial, from White's POV
+    RESULT_INDEX = { '0-1' : 0, '1/2-1/2' : 1, '1-0' : 2 }
 
-        # Find the Trinomial indices, from our POV, for a give game pair
-        def pair_to_trinomial(r1, r2):
-            lookup = { '0-1' : 0, '1/2-1/2' : 1, '1-0' : 2 }
-            return lookup[r1], 2 - lookup[r2]
+    @staticmethod
+    def update_results(results, line):
 
-        # Extract the game # and result str from a Cutechess line
-        def parse_finished_game(line):
-            tokens = line.split()
-            return int(tokens[2]), tokens[6]
+        # Extract the game #, result str, and adjudication reason from a Cutechess line
+        game, result, reason = Cutechess.FINISHED_GAME_REGEX.match(line).groups()
+        game = int(game)
 
         # Parse for errors resulting in adjudication
-        reason = line.split(':')[1]
         results['crashes'   ] += 'disconnect' in reason or 'stalls' in reason
         results['timelosses'] += 'on time' in reason
         results['illegals'  ] += 'illegal' in reason
 
-        # Parse Game # and result, and save
-        game, result = parse_finished_game(line)
+        # Save the result, and find the other game in the pair
         results['games'][game] = result
+        first, second = (game, game+1) if game % 2 else (game-1, game)
 
         # Check to see if the Pair has finished
-        first, second = game_to_pair(game)
         if first not in results['games'] or second not in results['games']:
             return
 
         # Get the indices for the Pentanomial, and the two for Trinomial
-        p = pair_to_penta(results['games'][first], results['games'][second])
-        t1, t2 = pair_to_trinomial(results['games'][first], results['games'][second])
+        r1 = Cutechess.RESULT_INDEX[results['games'][first ]]
+        r2 = Cutechess.RESULT_INDEX[results['games'][second]]
+        p, t1, t2 = r1 + 2 - r2, r1, 2 - r2
 
         # Update everything
         results['trinomial'  ][t1] += 1
@@ -637,13 +639,9 @@ class ResultsReporter(object):
             if os.path.isfile('openbench.exit'):
                 return self.abort_flag.set()
 
-        # Exhaust the Results Queue completely since Tasks are done
-        while True:
-            result = get_next_result()
-            if result:
-                self.pending.append(result)
-            else:
-                break
+        # Exhaust the Results Queue completely since Tasks are done, without blocking
+        while not self.results_queue.empty():
+            self.pending.append(self.results_queue.get_nowait())
 
         # Send any remaining results immediately
         self.send_results(report_interval=0, final_report=True)
@@ -722,15 +720,33 @@ def locate_utility(util, force_exit=True, report_error=True):
 
 def set_cutechess_permissions():
 
-    status = os.system('sudo -n chmod 777 cutechess-ob > /dev/null 2>&1')
+    # Nothing to do if a previous run already set the permissions
+    if os.access('cutechess-ob', os.X_OK):
+        return
 
-    if status != 0:
-        status = os.system('chmod 777 cutechess-ob > /dev/null 2>&1')
+    # Set the mode directly, without spawning a shell
+    try: return os.chmod('cutechess-ob', 0o755)
+    except OSError: pass
+
+    # Fallback for when a different user owns cutechess-ob, if sudo even exists
+    try:
+        status = subprocess.run(['sudo', '-n', 'chmod', '755', 'cutechess-ob'],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL).returncode
+    except OSError:
+        status = 1
 
     if status != 0:
         print ('[ERROR] Unable to set execute permissions on cutechess-ob')
 
 
+def jittered_timeout(timeout, errors=0):
+
+    # Double the timeout for each consecutive error, up to TIMEOUT_BACKOFF
+    timeout = min(timeout * 2 ** min(errors, 16), TIMEOUT_BACKOFF)
+
+    # Randomize by up to 50% either way, to avoid an entire fleet reconnecting at once
+    return timeout * (0.5 + random.random())
+
 def cleanup_client():
 
     SECONDS_PER_DAY   = 60 * 60 * 24
@@ -751,6 +767,16 @@ def cleanup_client():
         if file_age(os.path.join('Networks', file)) > SECONDS_PER_MONTH:
             os.remove(os.path.join('Networks', file))
 
+    # Staging directories are only left behind when a worker is killed mid-download or mid-build
+    for folder in os.listdir('Temp') if os.path.isdir('Temp') else []:
+        if file_age(os.path.join('Temp', folder)) > SECONDS_PER_DAY:
+            shutil.rmtree(os.path.join('Temp', folder), ignore_errors=True)
+
+    # Git caches only exist after building a public engine, and grow with every commit
+    for repo in os.listdir('SourceCache') if os.path.isdir('SourceCache') else []:
+        if file_age(os.path.join('SourceCache', repo)) > SECONDS_PER_WEEK:
+            shutil.rmtree(os.path.join('SourceCache', repo), ignore_errors=True)
+
 def validate_syzygy_exists(config, K):
 
     letters = ['', 'Q', 'R', 'B', 'N', 'P']
@@ -830,7 +856,7 @@ def scale_time_control(workload, scale_factor, branch):
 
 def find_pgn_error(reason, command):
 
-    pgn_file = command.split('-pgnout ')[1].split()[0]
+    pgn_file = command[command.index('-pgnout') + 1]
     with open(pgn_file, 'r') as fin:
         data = fin.readlines()
 
@@ -853,7 +879,7 @@ def server_configure_worker(config):
 
     # Server tells us how to build or obtain binaries
     target = url_join(config.server, 'clientGetBuildInfo')
-    data   = requests.get(target, timeout=TIMEOUT_HTTP).json()
+    data   = HTTP_SESSION.get(target, timeout=TIMEOUT_HTTP).json()
 
     config.scan_for_compilers(data)      # Public engine build tools
     config.scan_for_private_tokens(data) # Private engine access tokens
@@ -889,7 +915,7 @@ def server_configure_worker(config):
 
     # Send all of this to the server, and get a Machine Id + Secret Token
     target   = url_join(config.server, 'clientWorkerInfo')
-    response = requests.post(target, data=payload, timeout=TIMEOUT_HTTP).json()
+    response = HTTP_SESSION.post(target, data=payload, timeout=TIMEOUT_HTTP).json()
 
     # Delete the machine.txt if we have saved an invalid machine number
     if response.get('error', '').lower() == "bad machine id":
@@ -918,7 +944,7 @@ def server_request_workload(config):
 
     payload  = { 'machine_id' : config.machine_id, 'secret' : config.secret_token, 'blacklist' : config.blacklist }
     target   = url_join(config.server, 'clientGetWorkload')
-    response = requests.post(target, data=payload, timeout=TIMEOUT_HTTP)
+    response = HTTP_SESSION.post(target, data=payload, timeout=TIMEOUT_HTTP)
 
     # Server errors produce garbage back, which we should not alarm a user with
     try: response = response.json()
@@ -941,25 +967,53 @@ def server_request_workload(config):
         base_name   = response['workload']['test']['base']['name'  ]
         print('Workload [%s] %s vs [%s] %s\n' % (dev_engine, dev_name, base_engine, base_name))
 
-    config.workload = response.get('workload', None)
+    config.workload    = response.get('workload', None)
+    config.retry_after = parse_retry_after(response.get('retry_after'))
+
+def parse_retry_after(value):
+
+    # Optional hint from the Server, which must be a sane number of seconds
+    try: value = float(value)
+    except (TypeError, ValueError): return TIMEOUT_WORKLOAD
+
+    if not math.isfinite(value):
+        return TIMEOUT_WORKLOAD
+
+    return min(max(value, 1), TIMEOUT_BACKOFF)
 
 
 def complete_workload(config):
 
-    # Download the opening book, throws an exception on corruption
-    download_opening_book(
-        config.workload['test']['book']['sha'   ],
-        config.workload['test']['book']['source'],
-        config.workload['test']['book']['name'  ],
-    )
+    # Dev and Base may share a Network or a binary, which must not be fetched twice at once
+    dev_test       = config.workload['test']['dev' ]
+    base_test      = config.workload['test']['base']
+    shared_engine  = (dev_test['engine'], dev_test['sha']) == (base_test['engine'], base_test['sha'])
+    shared_network = dev_test['network'] not in [None, 'None'] and dev_test['network'] == base_test['network']
 
-    # Download each NNUE file, throws an exception on corruption
-    dev_network  = safe_download_network_weights(config, 'dev' )
-    base_network = safe_download_network_weights(config, 'base')
+    # Fetch the Book, and each Network + Engine, concurrently where possible
+    with ThreadPoolExecutor(max_workers=3) as executor:
 
-    # Build or download each engine, or exit if an error occured
-    dev_name  = safe_download_engine(config, 'dev' , dev_network )
-    base_name = safe_download_engine(config, 'base', base_network)
+        # Download the opening book, throws an exception on corruption
+        book_task = executor.submit(download_opening_book,
+            config.workload['test']['book']['sha'   ],
+            config.workload['test']['book']['source'],
+            config.workload['test']['book']['name'  ],
+        )
+
+        # Concurrent builds split the threads for make -j, rather than each using all of them
+        serial    = shared_engine or shared_network
+        dev_jobs  = config.threads if serial else config.threads - config.threads // 2
+        base_jobs = config.threads if serial else max(1, config.threads // 2)
+
+        # Download each NNUE file, and then build or download each engine
+        dev_task = executor.submit(safe_download_branch, config, 'dev', dev_jobs)
+        if serial: dev_task.result()
+        base_task = executor.submit(safe_download_branch, config, 'base', base_jobs)
+
+        # Collect in order, raising any Exceptions that occured
+        book_task.result()
+        dev_network , dev_name  = dev_task.result()
+        base_network, base_name = base_task.result()
 
     # Datagen creates a book on-the-fly
     if config.workload['test']['type'] == 'DATAGEN':
@@ -999,7 +1053,7 @@ def complete_workload(config):
     with ThreadPoolExecutor(max_workers=cutechess_cnt) as executor:
 
         timestamp  = time.time()
-        results    = multiprocessing.Queue()
+        results    = queue.Queue()
         abort_flag = threading.Event()
 
         tasks = [] # Create each of the Cutechess workers
@@ -1027,6 +1081,14 @@ def complete_workload(config):
             pgn_files  = [Cutechess.pgn_name(config, timestamp, x) for x in range(cutechess_cnt)]
             ServerReporter.report_pgn(config, compress_list_of_pgns(pgn_files, scale_factor, compact))
 
+def safe_download_branch(config, branch, make_jobs):
+
+    # Wraps safe_download_network_weights() and safe_download_engine()
+    # Returns the path to the Network, and the name of the binary
+
+    net_path = safe_download_network_weights(config, branch)
+    return net_path, safe_download_engine(config, branch, net_path, make_jobs)
+
 def safe_download_network_weights(config, branch):
 
     # Wraps utils.py:download_network()
@@ -1046,7 +1108,7 @@ def safe_download_network_weights(config, branch):
 
     return net_path
 
-def safe_download_engine(config, branch, net_path):
+def safe_download_engine(config, branch, net_path, make_jobs):
 
     # Wraps utils.py:download_public_engine() and utils.py:download_private_engine()
 
@@ -1076,7 +1138,7 @@ def safe_download_engine(config, branch, net_path):
 
         try:
             return download_public_engine(
-                engine, net_path, branch_name, source, make_path, out_path, compiler)
+                engine, net_path, branch_name, source, make_path, out_path, compiler, make_jobs, commit_sha)
 
         except OpenBenchBuildFailedException as error:
 
@@ -1104,36 +1166,94 @@ def safe_run_benchmarks(config, branch, engine, network):
     expected = int(config.workload['test'][branch]['bench'])
     binary   = os.path.join('Engines', engine)
 
-    try:
-        print('\nRunning %dx Benchmarks for %s' % (config.threads, name))
-        speed, nodes = bench.run_benchmark(
-            binary, network, private, config.threads, 1, expected)
+    # Reuse a recent benchmark of this exact binary, if it gave the expected bench
+    cached = read_cached_benchmark(binary, config.threads)
 
-    except OpenBenchBadBenchException as error:
-        ServerReporter.report_bad_bench(config, error.message)
-        raise
+    if cached and cached['bench'] == expected:
+        print('\nReusing %dx Benchmarks for %s' % (config.threads, name))
+        speed, nodes = cached['nps'], cached['bench']
+
+    else:
+
+        try:
+            print('\nRunning %dx Benchmarks for %s' % (config.threads, name))
+            speed, nodes = bench.run_benchmark(
+                binary, network, private, config.threads, 1, expected)
+
+        except OpenBenchBadBenchException as error:
+            ServerReporter.report_bad_bench(config, error.message)
+            raise
+
+        write_cached_benchmark(binary, config.threads, nodes, speed)
 
     print('Bench for %s is %d' % (name, nodes))
     print('Speed for %s is %d' % (name, speed))
     return speed
 
+def read_cached_benchmark(binary, threads):
+
+    # Cache Format: { binary : { threads, mtime, time, bench, nps } }
+    try:
+        with open('bench_cache.json') as fin:
+            entry = json.load(fin)[binary]
+
+        # Only valid for the same thread count, and for the same build of the binary
+        fresh = time.time() - entry['time'] < BENCH_CACHE_TTL
+        same  = entry['threads'] == threads and entry['mtime'] == os.path.getmtime(binary)
+        return entry if fresh and same else None
+
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+def write_cached_benchmark(binary, threads, nodes, speed):
+
+    # Problems with the cache are logged, but must never fail the workload
+    try:
+
+        try:
+            with open('bench_cache.json') as fin:
+                cache = json.load(fin)
+        except (OSError, ValueError):
+            cache = {}
+
+        # Drop anything expired or malformed, to keep the cache from growing forever
+        is_fresh = lambda v: isinstance(v, dict) \
+            and isinstance(v.get('time'), (int, float)) and time.time() - v['time'] < BENCH_CACHE_TTL
+        cache = { k : v for k, v in cache.items() if is_fresh(v) } if isinstance(cache, dict) else {}
+
+        cache[binary] = {
+            'threads' : threads,
+            'mtime'   : os.path.getmtime(binary),
+            'time'    : time.time(),
+            'bench'   : nodes,
+            'nps'     : speed,
+        }
+
+        # Replace the cache in one step, so an interruption never leaves it truncated
+        with open('bench_cache.json.tmp', 'w') as fout:
+            json.dump(cache, fout)
+        os.replace('bench_cache.json.tmp', 'bench_cache.json')
+
+    except Exception:
+        traceback.print_exc()
+        print ('[Note] Failed to update bench_cache.json...')
 
 def build_cutechess_command(config, dev_cmd, base_cmd, scale_factor, timestamp, cutechess_idx):
 
-    flags  = ' ' + Cutechess.basic_settings(config)
-    flags += ' ' + Cutechess.concurrency_settings(config)
-    flags += ' ' + Cutechess.adjudication_settings(config)
-    flags += ' ' + Cutechess.engine_settings(config, dev_cmd, 'dev', scale_factor, cutechess_idx)
-    flags += ' ' + Cutechess.engine_settings(config, base_cmd, 'base', scale_factor, cutechess_idx)
-    flags += ' ' + Cutechess.book_settings(config, cutechess_idx)
-    flags += ' ' + Cutechess.pgnout_settings(config, timestamp, cutechess_idx)
+    flags  = Cutechess.basic_settings(config)
+    flags += Cutechess.concurrency_settings(config)
+    flags += Cutechess.adjudication_settings(config)
+    flags += Cutechess.engine_settings(config, dev_cmd, 'dev', scale_factor, cutechess_idx)
+    flags += Cutechess.engine_settings(config, base_cmd, 'base', scale_factor, cutechess_idx)
+    flags += Cutechess.book_settings(config, cutechess_idx)
+    flags += Cutechess.pgnout_settings(config, timestamp, cutechess_idx)
 
-    return ['cutechess-ob.exe', './cutechess-ob'][IS_LINUX] + flags
+    return [['cutechess-ob.exe', './cutechess-ob'][IS_LINUX]] + flags
 
 def run_and_parse_cutechess(config, command, cutechess_idx, results_queue, abort_flag):
 
-    print('\n[#%d] Launching Cutechess...\n%s\n' % (cutechess_idx, command))
-    cutechess = Popen(command.split(), stdout=PIPE)
+    print('\n[#%d] Launching Cutechess...\n%s\n' % (cutechess_idx, ' '.join(command)))
+    cutechess = Popen(command, stdout=PIPE, encoding='ascii', errors='replace', bufsize=1 << 16)
 
     results = {
 
@@ -1146,21 +1266,25 @@ def run_and_parse_cutechess(config, command, cutechess_idx, results_queue, abort
         'illegals'    : 0,               # " illegal move "
     }
 
-    while True:
-
-        # Read each line of output until the pipe closes and we get "" back
-        line = cutechess.stdout.readline().strip().decode('ascii')
-        if not line:
-            break
+    # Read each line of output, already decoded, until the pipe closes
+    for line in cutechess.stdout:
 
         if abort_flag.is_set():
             break
 
-        if 'Started game' not in line and 'Score of' not in line:
+        # Skip blank lines, before doing any other parsing
+        if not (line := line.strip()):
+            continue
+
+        # Echo everything except the per-game progress lines
+        if not line.startswith(QUIET_CUTECHESS_LINES):
             print('[#%d] %s' % (cutechess_idx, line))
 
-        if 'Finished game' in line:
-            Cutechess.update_results(results, line)
+        # Only finished games need to be parsed for results
+        if not line.startswith('Finished game'):
+            continue
+
+        Cutechess.update_results(results, line)
 
         # Add to the results queue every time we have a game-pair finished
         if any(results['pentanomial']):
@@ -1223,13 +1347,23 @@ def run_openbench_worker(client_args):
     if IS_LINUX:
         set_cutechess_permissions()
 
+    errors = 0 # Consecutive failures, to back off from
+
     while True:
         try:
             # Cleanup on each workload request
             cleanup_client()
 
-            # Keep asking for a workload until we get a response
-            try_forever(server_request_workload, [config], connection_error)
+            # Failures fall through to the backoff below, which counts Server outages
+            try:
+                server_request_workload(config)
+
+            except BadVersionException:
+                raise
+
+            except Exception:
+                print ('\n\n' + connection_error)
+                raise
 
             # Complete the workload if there was work to be done
             if config.workload: complete_workload(config)
@@ -1238,7 +1372,10 @@ def run_openbench_worker(client_args):
             elif config.fleet: break
 
             # In either case, wait before requesting again
-            else: time.sleep(TIMEOUT_WORKLOAD)
+            else: time.sleep(jittered_timeout(config.retry_after))
+
+            # Any success resets the backoff
+            errors = 0
 
             # Check for exit signal via openbench.exit
             if os.path.isfile('openbench.exit'):
@@ -1250,4 +1387,5 @@ def run_openbench_worker(client_args):
 
         except Exception:
             traceback.print_exc()
-            time.sleep(TIMEOUT_ERROR)
+            time.sleep(jittered_timeout(TIMEOUT_ERROR, errors))
+            errors += 1